@@ -1,6 +1,6 @@
 from onediff.infer_compiler.oneflow_compiler_config import (
     oneflow_compiler_config as compiler_config,
 )
-from .compilers.diffusion_pipeline_compiler import compile_pipe
+from .compilers.diffusion_pipeline_compiler import compile_pipe, save_pipe, load_pipe
 
-__all__ = ["compile_pipe", "compiler_config"]
+__all__ = ["compile_pipe", "compiler_config", "save_pipe", "load_pipe"]
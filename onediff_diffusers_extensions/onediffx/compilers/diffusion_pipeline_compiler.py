@@ -1,4 +1,8 @@
+import os
 from onediff.infer_compiler import oneflow_compile
+from onediff.infer_compiler.with_oneflow_compile import DeployableModule
+from onediff.infer_compiler.transform.builtin_transform import torch2oflow
+from onediff.infer_compiler.utils.log_utils import logger
 
 
 def recursive_getattr(obj, attr, default=None):
@@ -17,9 +21,7 @@ def recursive_setattr(obj, attr, value):
     setattr(obj, attrs[-1], value)
 
 
-def compile_pipe(
-    pipe, *, ignores=(),
-):
+def filter_parts(ignores=()):
     parts = [
         "text_encoder",
         "text_encoder_2",
@@ -39,7 +41,13 @@ def compile_pipe(
                 break
         if not skip:
             filtered_parts.append(part)
-    for part in filtered_parts:
+    return filtered_parts
+
+
+def compile_pipe(
+    pipe, *, ignores=(),
+):
+    for part in filter_parts(ignores=ignores):
         obj = recursive_getattr(pipe, part, None)
         if obj is not None:
             print(f"Compiling {part}")
@@ -57,4 +65,43 @@ def compile_pipe(
     return pipe
 
 
-# TODO: Add save_pipe() and load_pipe()
+def save_pipe(pipe, dir="cached_pipe", *, ignores=(), overwrite=True):
+    """
+    Save the compiled graphs of a pipeline compiled by `compile_pipe`, one file per part.
+    Only parts that have already been run (and so compiled) are saved.
+    """
+    os.makedirs(dir, exist_ok=True)
+    for part in filter_parts(ignores=ignores):
+        obj = recursive_getattr(pipe, part, None)
+        if (
+            obj is not None
+            and isinstance(obj, DeployableModule)
+            and obj._deployable_module_dpl_graph is not None
+            and obj.get_graph().is_compiled
+        ):
+            file_path = os.path.join(dir, part)
+            if not overwrite and os.path.isfile(file_path):
+                continue
+            print(f"Saving {part}")
+            obj.save_graph(file_path)
+
+
+def load_pipe(pipe, dir="cached_pipe", *, ignores=(), device=None):
+    """
+    Load the graphs saved by `save_pipe` into a pipeline compiled by `compile_pipe`,
+    so the compiled shapes can be reused across processes without recompiling.
+    If `device` is set, the graphs are converted to that device while loading.
+    """
+    if not os.path.exists(dir):
+        logger.warning(f"Graph directory {dir} does not exist! Nothing is loaded.")
+        return
+    for part in filter_parts(ignores=ignores):
+        obj = recursive_getattr(pipe, part, None)
+        file_path = os.path.join(dir, part)
+        if (
+            obj is not None
+            and isinstance(obj, DeployableModule)
+            and os.path.exists(file_path)
+        ):
+            print(f"Loading {part}")
+            obj.load_graph(file_path, torch2oflow(device))
@@ -435,6 +435,7 @@ class StableDiffusionPipeline(OrgStableDiffusionPipeline):
         num_warmup_steps = len(timesteps) - num_inference_steps * self.scheduler.order
 
         prv_features = None
+        cfg_latents = None
         latents_list = [latents]
 
         if cache_interval == 1:
@@ -458,10 +459,16 @@ class StableDiffusionPipeline(OrgStableDiffusionPipeline):
         with self.progress_bar(total=num_inference_steps) as progress_bar:
             # print("[INFO] Update Feature Interval = {}, Update Layer Number = {}, Update Block Number = {}".format(cache_interval, cache_layer_id, cache_block_id))
             for i, t in enumerate(timesteps):
-                # expand the latents if we are doing classifier free guidance
-                latent_model_input = (
-                    torch.cat([latents] * 2) if do_classifier_free_guidance else latents
-                )
+                # expand the latents if we are doing classifier free guidance,
+                # writing into the same buffer every step instead of a new tensor
+                if do_classifier_free_guidance:
+                    if cfg_latents is None or cfg_latents.dtype != latents.dtype:
+                        cfg_latents = torch.cat([latents] * 2)
+                    else:
+                        torch.cat([latents] * 2, out=cfg_latents)
+                    latent_model_input = cfg_latents
+                else:
+                    latent_model_input = latents
                 latent_model_input = self.scheduler.scale_model_input(
                     latent_model_input, t
                 )
@@ -496,8 +503,9 @@ class StableDiffusionPipeline(OrgStableDiffusionPipeline):
                 # perform guidance
                 if do_classifier_free_guidance:
                     noise_pred_uncond, noise_pred_text = noise_pred.chunk(2)
-                    noise_pred = noise_pred_uncond + guidance_scale * (
-                        noise_pred_text - noise_pred_uncond
+                    # `uncond + w * (text - uncond)` in one elementwise kernel
+                    noise_pred = torch.lerp(
+                        noise_pred_uncond, noise_pred_text, guidance_scale
                     )
 
                 if do_classifier_free_guidance and guidance_rescale > 0.0:
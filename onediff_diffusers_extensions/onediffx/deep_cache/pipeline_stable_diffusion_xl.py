@@ -567,12 +567,19 @@ class StableDiffusionXLPipeline(OrgStableDiffusionXLPipeline):
         # print(interval_seq)
 
         prv_features = None
+        cfg_latents = None
         with self.progress_bar(total=num_inference_steps) as progress_bar:
             for i, t in enumerate(timesteps):
-                # expand the latents if we are doing classifier free guidance
-                latent_model_input = (
-                    torch.cat([latents] * 2) if do_classifier_free_guidance else latents
-                )
+                # expand the latents if we are doing classifier free guidance,
+                # writing into the same buffer every step instead of a new tensor
+                if do_classifier_free_guidance:
+                    if cfg_latents is None or cfg_latents.dtype != latents.dtype:
+                        cfg_latents = torch.cat([latents] * 2)
+                    else:
+                        torch.cat([latents] * 2, out=cfg_latents)
+                    latent_model_input = cfg_latents
+                else:
+                    latent_model_input = latents
 
                 latent_model_input = self.scheduler.scale_model_input(
                     latent_model_input, t
@@ -614,8 +621,9 @@ class StableDiffusionXLPipeline(OrgStableDiffusionXLPipeline):
                 # perform guidance
                 if do_classifier_free_guidance:
                     noise_pred_uncond, noise_pred_text = noise_pred.chunk(2)
-                    noise_pred = noise_pred_uncond + guidance_scale * (
-                        noise_pred_text - noise_pred_uncond
+                    # `uncond + w * (text - uncond)` in one elementwise kernel
+                    noise_pred = torch.lerp(
+                        noise_pred_uncond, noise_pred_text, guidance_scale
                     )
 
                 if do_classifier_free_guidance and guidance_rescale > 0.0:
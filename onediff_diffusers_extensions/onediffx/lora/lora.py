@@ -298,9 +298,10 @@ class LRUCacheDict(OrderedDict):
         return value
 
     def __setitem__(self, key, value):
-        if len(self) >= self.capacity:
-            oldest_key = next(iter(self))
-            del self[oldest_key]
+        if key in self:
+            self.move_to_end(key)
+        elif len(self) >= self.capacity:
+            self.popitem(last=False)
         super().__setitem__(key, value)
 
 
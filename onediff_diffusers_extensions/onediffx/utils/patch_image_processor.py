@@ -45,12 +45,15 @@ def postprocess(
     if do_denormalize is None:
         do_denormalize = [self.config.do_normalize] * image.shape[0]
 
-    image = torch.stack(
-        [
-            self.denormalize(image[i]) if do_denormalize[i] else image[i]
-            for i in range(image.shape[0])
-        ]
-    )
+    if all(do_denormalize):
+        image = _denormalize(image)
+    elif any(do_denormalize):
+        image = torch.stack(
+            [
+                self.denormalize(image[i]) if do_denormalize[i] else image[i]
+                for i in range(image.shape[0])
+            ]
+        )
 
     if output_type == "pt":
         return image
@@ -67,6 +70,12 @@ def postprocess(
     #     return self.numpy_to_pil(image)
 
 
+@torch.jit.script
+def _denormalize(images):
+    # same as `VaeImageProcessor.denormalize`, but on the whole batch at once
+    return (images / 2 + 0.5).clamp(0, 1)
+
+
 @torch.jit.script
 def _pt_to_numpy_pre(images):
     return images.permute(0, 2, 3, 1).contiguous().float().cpu()
@@ -3,38 +3,92 @@ import oneflow as flow
 from oneflow.framework.args_tree import ArgsTree
 from .log_utils import logger
 
+# Leaf types that ArgsTree maps as-is. Values made of tensors and these, nested at
+# most one level in a plain dict/list/tuple (e.g. `added_cond_kwargs` of SDXL or
+# the `(sample, prv_feature)` output of DeepCache UNet), can skip building an ArgsTree.
+_FLAT_LEAF_TYPES = (type(None), bool, int, float, str)
+_FLAT_CONTAINER_TYPES = (dict, list, tuple)
 
-def input_output_processor(func):
-    def process_input(*args, **kwargs):
-        def input_fn(value):
-            if isinstance(value, torch.Tensor):
-                # TODO: https://github.com/siliconflow/sd-team/issues/109
-                return flow.utils.tensor.from_torch(value.contiguous())
-            else:
-                return value
-
-        args_tree = ArgsTree((args, kwargs), False, tensor_type=torch.Tensor)
-        input_count = len(
-            [v for v in args_tree.iter_nodes() if isinstance(v, torch.Tensor)]
-        )
-        out = args_tree.map_leaf(input_fn)
-        mapped_args = out[0]
-        mapped_kwargs = out[1]
+
+def _is_flat_leaf(value, tensor_type):
+    return isinstance(value, tensor_type) or type(value) in _FLAT_LEAF_TYPES
+
+
+def _is_shallow(value, tensor_type):
+    if type(value) is dict:
+        return all(_is_flat_leaf(v, tensor_type) for v in value.values())
+    if type(value) in _FLAT_CONTAINER_TYPES:
+        return all(_is_flat_leaf(v, tensor_type) for v in value)
+    return _is_flat_leaf(value, tensor_type)
+
+
+def _map_shallow(fn, value):
+    if type(value) is dict:
+        return {k: fn(v) for k, v in value.items()}
+    if type(value) in _FLAT_CONTAINER_TYPES:
+        return type(value)(fn(v) for v in value)
+    return fn(value)
+
+
+def _count_shallow_tensors(value, tensor_type):
+    if type(value) is dict:
+        value = value.values()
+    elif type(value) not in _FLAT_CONTAINER_TYPES:
+        value = (value,)
+    return sum(1 for v in value if isinstance(v, tensor_type))
+
+
+def _input_fn(value):
+    if isinstance(value, torch.Tensor):
+        # TODO: https://github.com/siliconflow/sd-team/issues/109
+        return flow.utils.tensor.from_torch(value.contiguous())
+    else:
+        return value
+
+
+def _output_fn(value):
+    if isinstance(value, flow.Tensor):
+        return flow.utils.tensor.to_torch(value)
+    else:
+        return value
+
+
+def _process_input(*args, **kwargs):
+    # Fast path for the common call like `unet(sample, t, encoder_hidden_states=...)`
+    values = args + tuple(kwargs.values())
+    if all(_is_shallow(v, torch.Tensor) for v in values):
+        mapped_args = tuple(_map_shallow(_input_fn, v) for v in args)
+        mapped_kwargs = {k: _map_shallow(_input_fn, v) for k, v in kwargs.items()}
+        input_count = sum(_count_shallow_tensors(v, torch.Tensor) for v in values)
         return mapped_args, mapped_kwargs, input_count
 
-    def process_output(output):
-        def output_fn(value):
-            if isinstance(value, flow.Tensor):
-                return flow.utils.tensor.to_torch(value)
-            else:
-                return value
+    args_tree = ArgsTree((args, kwargs), False, tensor_type=torch.Tensor)
+    input_count = len(
+        [v for v in args_tree.iter_nodes() if isinstance(v, torch.Tensor)]
+    )
+    out = args_tree.map_leaf(_input_fn)
+    mapped_args = out[0]
+    mapped_kwargs = out[1]
+    return mapped_args, mapped_kwargs, input_count
 
-        out_tree = ArgsTree((output, None), False)
-        out = out_tree.map_leaf(output_fn)
-        return out[0]
 
+def _process_output(output):
+    if isinstance(output, flow.Tensor):
+        return _output_fn(output)
+    if type(output) in _FLAT_CONTAINER_TYPES and all(
+        _is_shallow(v, flow.Tensor)
+        for v in (output.values() if type(output) is dict else output)
+    ):
+        return _map_shallow(lambda v: _map_shallow(_output_fn, v), output)
+
+    out_tree = ArgsTree((output, None), False)
+    out = out_tree.map_leaf(_output_fn)
+    return out[0]
+
+
+def input_output_processor(func):
     def wrapper(self: "DeployableModule", *args, **kwargs):
-        mapped_args, mapped_kwargs, input_count = process_input(*args, **kwargs)
+        mapped_args, mapped_kwargs, input_count = _process_input(*args, **kwargs)
         if (
             self._deployable_module_use_graph
             and self._deployable_module_dpl_graph is not None
@@ -48,6 +102,6 @@ def input_output_processor(func):
                 self._load_graph_first_run = True
 
         output = func(self, *mapped_args, **mapped_kwargs)
-        return process_output(output)
+        return _process_output(output)
 
     return wrapper
@@ -444,6 +444,11 @@ def oneflow_compile(
         - 'size' which config the cache size when cache is enabled. Note that after onediff v0.12, cache is default disabled.
         - 'graph_file' (None) generates a compilation cache file. If the file exists, loading occurs; if not, the compilation result is saved after the first run.
         - 'graph_file_device' (None) sets the device for the graph file, default None.  If set, the compilation result will be converted to the specified device.
+
+    Kernel launch fusion and CUDA Graph are process wide switches read by OneFlow while it builds and runs a graph,
+    so they are not per module options. To use them, set `compiler_config.mlir_fuse_kernel_launch` and
+    `compiler_config.kernel_enable_cuda_graph` to True for a process that only compiles modules with dynamic=False,
+    as CUDA Graph fails on the multi resolution warmup of a dynamic graph.
     """
 
     set_default_registry()
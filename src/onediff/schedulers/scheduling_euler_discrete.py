@@ -181,6 +181,7 @@ class EulerDiscreteScheduler(SchedulerMixin, ConfigMixin):
         sigmas = np.array(((1 - self.alphas_cumprod) / self.alphas_cumprod) ** 0.5)
         sigmas = np.concatenate([sigmas[::-1], [0.0]]).astype(np.float32)
         self.sigmas = torch.from_numpy(sigmas)
+        self.input_scales = torch.rsqrt(self.sigmas ** 2 + 1)
         dts = np.array([sigmas[i + 1] - sigmas[i] for i in range(len(sigmas) - 1)])
         self.dts = torch.from_numpy(dts)
 
@@ -190,6 +191,7 @@ class EulerDiscreteScheduler(SchedulerMixin, ConfigMixin):
             0, num_train_timesteps - 1, num_train_timesteps, dtype=float
         )[::-1].copy()
         self.timesteps = torch.from_numpy(timesteps)
+        self._step_index = None
         self.is_scale_input_called = False
         self.use_karras_sigmas = use_karras_sigmas
 
@@ -201,6 +203,20 @@ class EulerDiscreteScheduler(SchedulerMixin, ConfigMixin):
 
         return (self.sigmas.max() ** 2 + 1) ** 0.5
 
+    @property
+    def step_index(self):
+        """
+        The index counter for current timestep. It will increase 1 after each scheduler step.
+        """
+        return self._step_index
+
+    def _init_step_index(self, timestep: Union[float, torch.FloatTensor]):
+        # Only the first step of a run looks up (and syncs on) the timestep,
+        # later steps just follow the counter advanced in `step`.
+        if isinstance(timestep, torch.Tensor):
+            timestep = timestep.to(self.timesteps.device)
+        self._step_index = (self.timesteps == timestep).nonzero().item()
+
     def scale_model_input(
         self, sample: torch.FloatTensor, timestep: Union[float, torch.FloatTensor]
     ) -> torch.FloatTensor:
@@ -214,12 +230,9 @@ class EulerDiscreteScheduler(SchedulerMixin, ConfigMixin):
         Returns:
             `torch.FloatTensor`: scaled input sample
         """
-        if isinstance(timestep, torch.Tensor):
-            timestep = timestep.to(self.timesteps.device)
-        step_index = (self.timesteps == timestep).nonzero().item()
-        sigma = self.sigmas[step_index]
-
-        sample = sample / ((sigma ** 2 + 1) ** 0.5)
+        if self._step_index is None:
+            self._init_step_index(timestep)
+        sample = sample * self.input_scales[self._step_index]
 
         self.is_scale_input_called = True
         return sample
@@ -295,13 +308,17 @@ class EulerDiscreteScheduler(SchedulerMixin, ConfigMixin):
 
         sigmas = np.concatenate([sigmas, [0.0]]).astype(np.float32)
         self.sigmas = torch.from_numpy(sigmas).to(device=device)
+        # `1 / (sigma**2 + 1) ** 0.5` for every step, so that `scale_model_input`
+        # is a single multiply instead of recomputing the scale from sigma
+        self.input_scales = torch.rsqrt(self.sigmas ** 2 + 1)
         dts = np.array([sigmas[i + 1] - sigmas[i] for i in range(len(sigmas) - 1)])
-        self.dts = torch.from_numpy(dts)
+        self.dts = torch.from_numpy(dts).to(device=device)
         if str(device).startswith("mps"):
             # mps does not support float64
             self.timesteps = torch.from_numpy(timesteps).to(device, dtype=torch.float32)
         else:
             self.timesteps = torch.from_numpy(timesteps).to(device=device)
+        self._step_index = None
 
     def _sigma_to_t(self, sigma, log_sigmas):
         # get log sigma
@@ -400,10 +417,9 @@ class EulerDiscreteScheduler(SchedulerMixin, ConfigMixin):
                 "See `StableDiffusionPipeline` for a usage example."
             )
 
-        if isinstance(timestep, torch.Tensor):
-            timestep = timestep.to(self.timesteps.device)
-
-        step_index = (self.timesteps == timestep).nonzero().item()
+        if self._step_index is None:
+            self._init_step_index(timestep)
+        step_index = self._step_index
         sigma = self.sigmas[step_index]
 
         noise = randn_tensor(
@@ -455,6 +471,9 @@ class EulerDiscreteScheduler(SchedulerMixin, ConfigMixin):
 
         prev_sample = sample + derivative * dt
 
+        # upon completion increase step index by one
+        self._step_index += 1
+
         if not return_dict:
             return (prev_sample,)
 
@@ -0,0 +1,101 @@
+import unittest
+
+import numpy as np
+import oneflow as flow
+import torch
+from oneflow.framework.args_tree import ArgsTree
+
+from onediff.infer_compiler.utils.args_tree_util import (
+    _input_fn,
+    _is_shallow,
+    _output_fn,
+    _process_input,
+    _process_output,
+)
+
+
+def _reference_process_input(*args, **kwargs):
+    args_tree = ArgsTree((args, kwargs), False, tensor_type=torch.Tensor)
+    input_count = len(
+        [v for v in args_tree.iter_nodes() if isinstance(v, torch.Tensor)]
+    )
+    out = args_tree.map_leaf(_input_fn)
+    return out[0], out[1], input_count
+
+
+def _reference_process_output(output):
+    return ArgsTree((output, None), False).map_leaf(_output_fn)[0]
+
+
+class InputOutputProcessorTest(unittest.TestCase):
+    def _assert_same(self, value, expected):
+        self.assertIs(type(value), type(expected))
+        if isinstance(expected, dict):
+            self.assertEqual(list(value.keys()), list(expected.keys()))
+            for k in expected:
+                self._assert_same(value[k], expected[k])
+        elif isinstance(expected, (list, tuple)):
+            self.assertEqual(len(value), len(expected))
+            for v, e in zip(value, expected):
+                self._assert_same(v, e)
+        elif isinstance(expected, (torch.Tensor, flow.Tensor)):
+            self.assertTrue(np.array_equal(value.numpy(), expected.numpy()))
+        else:
+            self.assertEqual(value, expected)
+
+    def _check_input(self, *args, **kwargs):
+        self._assert_same(
+            _process_input(*args, **kwargs), _reference_process_input(*args, **kwargs)
+        )
+
+    def test_unet_input(self):
+        sample = torch.randn(2, 4, 8, 8)
+        self._check_input(
+            sample,
+            torch.tensor(999),
+            encoder_hidden_states=torch.randn(2, 77, 32),
+            cross_attention_kwargs={"scale": 0.5},
+            return_dict=False,
+        )
+        self._check_input(sample, 999, None, return_dict=False)
+
+    def test_sdxl_added_cond_kwargs_input(self):
+        added_cond_kwargs = {
+            "text_embeds": torch.randn(2, 1280),
+            "time_ids": torch.randn(2, 6),
+        }
+        self.assertTrue(_is_shallow(added_cond_kwargs, torch.Tensor))
+        self._check_input(
+            torch.randn(2, 4, 8, 8),
+            torch.tensor(999),
+            encoder_hidden_states=torch.randn(2, 77, 32),
+            added_cond_kwargs=added_cond_kwargs,
+            down_block_additional_residuals=[torch.randn(2, 4, 8, 8)] * 2,
+        )
+
+    def test_nested_input_falls_back(self):
+        nested = {"adapter": {"scale": torch.randn(1)}}
+        self.assertFalse(_is_shallow(nested, torch.Tensor))
+        self._check_input(torch.randn(2, 4), cross_attention_kwargs=nested)
+        self._check_input(torch.randn(2, 4), [(torch.randn(1), 1.0)])
+
+    def test_deep_cache_output(self):
+        sample = flow.randn(2, 4, 8, 8)
+        for output in [
+            sample,
+            (sample, None),
+            (sample, flow.randn(2, 4, 8, 8)),
+            {"sample": sample},
+        ]:
+            self._assert_same(
+                _process_output(output), _reference_process_output(output)
+            )
+
+    def test_nested_output_falls_back(self):
+        output = (flow.randn(2, 4), [(flow.randn(1), None)])
+        self.assertFalse(all(_is_shallow(v, flow.Tensor) for v in output))
+        self._assert_same(_process_output(output), _reference_process_output(output))
+
+
+if __name__ == "__main__":
+    unittest.main()
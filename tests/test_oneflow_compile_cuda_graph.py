@@ -0,0 +1,45 @@
+import numpy as np
+from onediff.infer_compiler import oneflow_compile, oneflow_compiler_config
+import torch
+import torch.nn as nn
+
+
+class MyModule(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.linear1 = nn.Linear(10, 10)
+        self.linear2 = nn.Linear(10, 10)
+
+    def forward(self, x):
+        return self.linear2(torch.relu(self.linear1(x)))
+
+
+prev_fuse_kernel_launch = oneflow_compiler_config.mlir_fuse_kernel_launch
+prev_enable_cuda_graph = oneflow_compiler_config.kernel_enable_cuda_graph
+try:
+    oneflow_compiler_config.mlir_fuse_kernel_launch = True
+    oneflow_compiler_config.kernel_enable_cuda_graph = True
+
+    m = MyModule().to("cuda")
+    x = torch.randn(2, 10).to("cuda")
+    y_torch = m(x)
+
+    m = oneflow_compile(m, dynamic=False)
+    for _ in range(3):
+        y_oneflow = m(x)
+
+    assert np.allclose(y_torch.detach().cpu(), y_oneflow.detach().cpu(), 1e-03, 1e-03)
+finally:
+    oneflow_compiler_config.mlir_fuse_kernel_launch = prev_fuse_kernel_launch
+    oneflow_compiler_config.kernel_enable_cuda_graph = prev_enable_cuda_graph
+
+# A dynamic graph compiled afterwards runs without CUDA Graph
+assert oneflow_compiler_config.mlir_fuse_kernel_launch == prev_fuse_kernel_launch
+assert oneflow_compiler_config.kernel_enable_cuda_graph == prev_enable_cuda_graph
+m_torch = MyModule().to("cuda")
+m_dynamic = oneflow_compile(m_torch)
+for shape in [(2, 10), (4, 10)]:
+    x = torch.randn(*shape).to("cuda")
+    y_torch = m_torch(x)
+    y_oneflow = m_dynamic(x)
+    assert np.allclose(y_torch.detach().cpu(), y_oneflow.detach().cpu(), 1e-03, 1e-03)
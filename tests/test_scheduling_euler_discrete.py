@@ -0,0 +1,82 @@
+import unittest
+
+import torch
+
+from onediff.schedulers import EulerDiscreteScheduler
+
+
+def _reference_scale_model_input(scheduler, sample, timestep):
+    step_index = (scheduler.timesteps == timestep).nonzero().item()
+    sigma = scheduler.sigmas[step_index]
+    return sample / ((sigma ** 2 + 1) ** 0.5)
+
+
+def _reference_step(scheduler, model_output, timestep, sample):
+    step_index = (scheduler.timesteps == timestep).nonzero().item()
+    sigma = scheduler.sigmas[step_index]
+    if scheduler.config.prediction_type == "epsilon":
+        pred_original_sample = sample - sigma * model_output
+    else:
+        pred_original_sample = model_output * (-sigma / (sigma ** 2 + 1) ** 0.5) + (
+            sample / (sigma ** 2 + 1)
+        )
+    derivative = (sample - pred_original_sample) / sigma
+    dt = scheduler.sigmas[step_index + 1] - sigma
+    return sample + derivative * dt
+
+
+class EulerDiscreteSchedulerTest(unittest.TestCase):
+    def _check_parity(self, num_runs=2, **config):
+        scheduler = EulerDiscreteScheduler(
+            beta_start=0.00085, beta_end=0.012, beta_schedule="scaled_linear", **config
+        )
+        generator = torch.manual_seed(0)
+        for _ in range(num_runs):
+            scheduler.set_timesteps(10)
+            latents = torch.randn(1, 4, 8, 8, generator=generator)
+            latents = latents * scheduler.init_noise_sigma
+            for t in scheduler.timesteps:
+                model_input = scheduler.scale_model_input(latents, t)
+                self.assertTrue(
+                    torch.allclose(
+                        model_input,
+                        _reference_scale_model_input(scheduler, latents, t),
+                        atol=1e-6,
+                    )
+                )
+                model_output = torch.randn(latents.shape, generator=generator)
+                prev_sample = scheduler.step(
+                    model_output, t, latents, return_dict=False
+                )[0]
+                self.assertTrue(
+                    torch.allclose(
+                        prev_sample,
+                        _reference_step(scheduler, model_output, t, latents),
+                        atol=1e-5,
+                    )
+                )
+                latents = prev_sample
+
+    def test_epsilon(self):
+        self._check_parity()
+
+    def test_v_prediction(self):
+        self._check_parity(prediction_type="v_prediction")
+
+    def test_karras_sigmas(self):
+        self._check_parity(use_karras_sigmas=True)
+
+    def test_step_index_reset_by_set_timesteps(self):
+        scheduler = EulerDiscreteScheduler()
+        scheduler.set_timesteps(5)
+        sample = torch.ones(1, 4, 8, 8)
+        for t in scheduler.timesteps[:3]:
+            scheduler.scale_model_input(sample, t)
+            scheduler.step(torch.zeros_like(sample), t, sample)
+        self.assertEqual(scheduler.step_index, 3)
+        scheduler.set_timesteps(5)
+        self.assertIsNone(scheduler.step_index)
+
+
+if __name__ == "__main__":
+    unittest.main()